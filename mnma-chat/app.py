@@ -1,16 +1,20 @@
+import os
 import yaml
+import uvloop
 import logging
 import asyncio
-from typing import Optional
 from fastapi import FastAPI
 from fastapi import WebSocket
-from async_queue import AsyncQueue
 from fastapi.middleware.cors import CORSMiddleware
 
 import async_socket_to_chat
 import async_question_to_answer
 import async_answer_to_socket
 
+# Use the libuv-backed event loop for faster websocket reads/writes
+# and queue wake-ups.
+uvloop.install()
+
 app = FastAPI()
 
 app.add_middleware(
@@ -24,53 +28,37 @@ app.add_middleware(
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("chat")
 
-@app.websocket("/chat/{userid}/{conversation_id}/{files_ids}")
-async def chat_client(websocket: WebSocket,  userid: str, conversation_id: str, files_ids: Optional[str]):
-    """
-    WebSocket endpoint to handle real-time chat communication.
+# Cap per-connection queues so a slow or silently-gone client cannot grow
+# the response backlog without bound; producers await put() when full.
+QUEUE_MAXSIZE = 1024
 
-    Args:
-        websocket (WebSocket): WebSocket connection object.
-        userid (str): Unique identifier for the user.
-        conversation_id (str): Unique identifier for the conversation.
-        files_ids (str): Comma-separated list of file identifiers.
+def set_cpu_affinity():
     """
-    logger.info(f"Chat client connected: {userid}")
-    if files_ids:
-        if ',' in files_ids:
-            files = files_ids.split(",")
-        else:
-            files = [files_ids]
-    else:
-        files=[]
-    logger.info(f"Files: {files}")
-
-    with open('config.yml', 'r') as file:
-        config = yaml.safe_load(file)   
-    
-    question_queue = AsyncQueue()
-    response_queue = AsyncQueue()
-    
-    data_obj = {
-        "conversation_id": conversation_id,
-        "user_id": userid,
-        "files": files
-    }
-    logger.info(f"Data object: {data_obj}")
-
-    answer_to_socket_promise = async_answer_to_socket.loop(response_queue, websocket)
-    question_to_answer_promise = async_question_to_answer.loop(question_queue, response_queue, config, data_obj)
-    socket_to_chat_promise = async_socket_to_chat.loop(websocket, question_queue, response_queue)
+    Pin this worker process to a single CPU core so the scheduler stops
+    migrating it across cores (and NUMA nodes), which trashes caches on
+    every socket read. Opt-in via PIN_CPU_AFFINITY=1; the worker index
+    comes from UVICORN_WORKER_ID or falls back to the PID.
+    """
+    if os.environ.get("PIN_CPU_AFFINITY") != "1":
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpu_count = os.cpu_count() or 1
+    worker_id = int(os.environ.get("UVICORN_WORKER_ID", os.getpid()))
+    core = worker_id % cpu_count
+    os.sched_setaffinity(0, {core})
+    logger.info(f"Pinned worker to CPU core {core}")
 
-    await asyncio.gather(
-        answer_to_socket_promise,
-        question_to_answer_promise,
-        socket_to_chat_promise,
-    )
+set_cpu_affinity()
 
+# Parse the config once at import time; re-reading YAML per connection
+# blocks the event loop for no benefit.
+with open('config.yml', 'r') as file:
+    CONFIG = yaml.safe_load(file)
 
 @app.websocket("/chat/{userid}/{conversation_id}/")
-async def chat_client(websocket: WebSocket,  userid: str, conversation_id: str):
+@app.websocket("/chat/{userid}/{conversation_id}/{files_ids}")
+async def chat_client(websocket: WebSocket, userid: str, conversation_id: str, files_ids: str = ""):
     """
     WebSocket endpoint to handle real-time chat communication.
 
@@ -78,27 +66,28 @@ async def chat_client(websocket: WebSocket,  userid: str, conversation_id: str):
         websocket (WebSocket): WebSocket connection object.
         userid (str): Unique identifier for the user.
         conversation_id (str): Unique identifier for the conversation.
+        files_ids (str): Comma-separated list of file identifiers, may be empty.
     """
     logger.info(f"Chat client connected: {userid}")
-    with open('config.yml', 'r') as file:
-        config = yaml.safe_load(file)   
-    
+    files = files_ids.split(",") if files_ids else []
+    logger.info(f"Files: {files}")
+
+    question_queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    response_queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+
     data_obj = {
         "conversation_id": conversation_id,
         "user_id": userid,
-        "files": []
+        "files": files
     }
     logger.info(f"Data object: {data_obj}")
 
-    question_queue = AsyncQueue()
-    response_queue = AsyncQueue()
-
     answer_to_socket_promise = async_answer_to_socket.loop(response_queue, websocket)
-    question_to_answer_promise = async_question_to_answer.loop(question_queue, response_queue, config, data_obj)
+    question_to_answer_promise = async_question_to_answer.loop(question_queue, response_queue, CONFIG, data_obj)
     socket_to_chat_promise = async_socket_to_chat.loop(websocket, question_queue, response_queue)
 
     await asyncio.gather(
         answer_to_socket_promise,
         question_to_answer_promise,
         socket_to_chat_promise,
-    )
\ No newline at end of file
+    )
@@ -1,28 +1,92 @@
+import asyncio
 import logging
 from fastapi import WebSocket
-from async_queue import AsyncQueue
 import control_flow_commands as cfc
 import starlette.websockets as ws
+from async_question_to_answer import DISCONNECT_FRAME
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("chat")
 
-async def loop(response_queue: AsyncQueue, websocket: WebSocket):
+# Caps for coalesced frames, so batching never delays a frame for too long
+# or produces oversized frames.
+MAX_BATCH_MESSAGES = 64
+MAX_BATCH_BYTES = 64 * 1024
+
+async def _drain(response_queue: asyncio.Queue):
+    """
+    Discards queued frames until the producer's DISCONNECT_FRAME arrives.
+
+    The response queue is bounded, so simply breaking on disconnect would
+    leave an in-flight answer in async_question_to_answer.loop blocked on
+    put() forever. The producer only reads its own disconnect sentinel
+    after the current answer finishes streaming, so its last frame is
+    always DISCONNECT_FRAME; consuming up to it guarantees the producer
+    exits.
+
+    Args:
+        response_queue (asyncio.Queue): Queue containing msgpack-encoded messages for the client.
+    """
+    while True:
+        data = await response_queue.get()
+        if data == DISCONNECT_FRAME:
+            break
+
+async def loop(response_queue: asyncio.Queue, websocket: WebSocket):
     """
     Main loop for sending data from the response queue to the WebSocket client.
-    
+
+    Queue items are msgpack-encoded bytes. Messages already waiting in the
+    queue are concatenated into a single binary frame containing a msgpack
+    stream of one or more objects, so bursts (e.g. a chat history replay)
+    cost one frame instead of one frame per message. Clients decode frames
+    with a streaming msgpack unpacker.
+
     Args:
-        response_queue (AsyncQueue): Queue containing data to be sent to the WebSocket client.
+        response_queue (asyncio.Queue): Queue containing msgpack-encoded messages for the client.
         websocket (WebSocket): WebSocket connection object.
     """
+    # Set once the producer's DISCONNECT_FRAME has been consumed; it can
+    # arrive ahead of the reader's sentinel, in which case there is nothing
+    # left to drain.
+    producer_done = False
     while True:
-        data = await response_queue.dequeue()
+        data = await response_queue.get()
 
         if data == cfc.CFC_CLIENT_DISCONNECTED:
+            if not producer_done:
+                await _drain(response_queue)
+            break
+        if data == DISCONNECT_FRAME:
+            producer_done = True
+
+        batch = [data]
+        batch_bytes = len(data)
+        disconnected = False
+        while (
+            len(batch) < MAX_BATCH_MESSAGES
+            and batch_bytes < MAX_BATCH_BYTES
+            and not response_queue.empty()
+        ):
+            extra = response_queue.get_nowait()
+            if extra == cfc.CFC_CLIENT_DISCONNECTED:
+                disconnected = True
+                break
+            if extra == DISCONNECT_FRAME:
+                producer_done = True
+            batch.append(extra)
+            batch_bytes += len(extra)
+
+        payload = batch[0] if len(batch) == 1 else b"".join(batch)
+        logger.info(f"Sending {len(batch)} message(s)")
+        try:
+            await websocket.send_bytes(payload)
+        except (ws.WebSocketDisconnect, RuntimeError):
+            # RuntimeError: the reader closed the socket server-side after
+            # an unreadable frame; treat it the same as a client disconnect.
+            disconnected = True
+
+        if disconnected:
+            if not producer_done:
+                await _drain(response_queue)
             break
-        else:
-            logger.info(f"Sending data: {data}")
-            try:
-                await websocket.send_text(data)
-            except ws.WebSocketDisconnect:
-                break
\ No newline at end of file
@@ -1,66 +1,97 @@
-import json
+import asyncio
 import logging
-from async_queue import AsyncQueue
+import msgpack
 import control_flow_commands as cfc
 from chat_retriever import ChatRetriever
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("chat")
 
+# Control-flow frames never change, so pack them once at import time.
+DISCONNECT_FRAME = msgpack.packb({
+    "reporter": "output_message",
+    "type": "disconnect_message",
+})
+START_FRAME = msgpack.packb({
+    "reporter": "output_message",
+    "type": "start_message",
+})
+STOP_FRAME = msgpack.packb({
+    "reporter": "output_message",
+    "type": "stop_message",
+})
+ANSWER_COMPLETE_FRAME = msgpack.packb({
+    "reporter": "output_message",
+    "type": "answer_complete",
+})
+ERROR_FRAME = msgpack.packb({
+    "reporter": "output_message",
+    "type": "error_message",
+})
+
 async def loop(
-        questions_queue: AsyncQueue,
-        response_queue: AsyncQueue,
+        questions_queue: asyncio.Queue,
+        response_queue: asyncio.Queue,
         config: dict,
         data_obj: dict
 ):
     """
     Main loop for processing chat interactions.
-    
+
+    Responses are queued as msgpack-encoded bytes, ready to be written to
+    the websocket as binary frames.
+
     Args:
-        questions_queue (AsyncQueue): Queue for incoming user questions.
-        response_queue (AsyncQueue): Queue for outgoing responses to the user.
+        questions_queue (asyncio.Queue): Queue for incoming user questions.
+        response_queue (asyncio.Queue): Queue for outgoing responses to the user.
         config (dict): Configuration dictionary.
         data_obj (dict): Data object containing user and conversation information.
     """
     user_id = data_obj["user_id"]
     files_ids = data_obj["files"]
     conversation_id = data_obj["conversation_id"]
-    chat_retriever = ChatRetriever(config, user_id, files_ids, conversation_id)
-    
-    while True:
-        data = await questions_queue.dequeue()
-        data = data.replace("\n", "")
-        if data == cfc.CFC_CLIENT_DISCONNECTED:
-            response_queue.enqueue(
-                json.dumps({
-                    "reporter": "output_message",
-                    "type": "disconnect_message",
-                })
-            )
-            break
-        if data == cfc.CFC_CHAT_STARTED:
-            response_queue.enqueue(
-                json.dumps({
-                    "reporter": "output_message",
-                    "type": "start_message",
-                })
-            )
-            history = chat_retriever.get_user_history()
-            for message in history:
-                response_queue.enqueue(json.dumps(message))
-        elif data == cfc.CFC_CHAT_STOPPED:
-            response_queue.enqueue(
-                json.dumps({
-                    "reporter": "output_message",
-                    "type": "stop_message",
-                })
-            )
-        elif data:
-            answer = chat_retriever.query(data)
-            response_queue.enqueue(
-                json.dumps({
-                    "reporter": "output_message",
-                    "type": "answer",
-                    "message": answer,
-                })
-            )
\ No newline at end of file
+    # DISCONNECT_FRAME must be this loop's last put no matter how it exits:
+    # async_answer_to_socket drains the response queue up to that frame
+    # after a disconnect, so dying by exception without enqueuing it would
+    # block the consumer forever.
+    try:
+        # Client construction and history reads are blocking I/O; run them on a
+        # thread so one connection's setup cannot stall every other session.
+        chat_retriever = await asyncio.to_thread(
+            ChatRetriever, config, user_id, files_ids, conversation_id
+        )
+
+        while True:
+            data = await questions_queue.get()
+            # str.replace always allocates a new string; skip it when there is
+            # nothing to strip, which is the common case.
+            if "\n" in data:
+                data = data.replace("\n", "")
+            if data == cfc.CFC_CLIENT_DISCONNECTED:
+                break
+            if data == cfc.CFC_CHAT_STARTED:
+                await response_queue.put(START_FRAME)
+                history = await asyncio.to_thread(chat_retriever.get_user_history)
+                for message in history:
+                    await response_queue.put(msgpack.packb(message))
+            elif data == cfc.CFC_CHAT_STOPPED:
+                await response_queue.put(STOP_FRAME)
+            elif data:
+                try:
+                    async for chunk in chat_retriever.astream(data):
+                        await response_queue.put(
+                            msgpack.packb({
+                                "reporter": "output_message",
+                                "type": "answer_chunk",
+                                "message": chunk,
+                            })
+                        )
+                except Exception as e:
+                    # A Bedrock/Qdrant failure ends this answer, not the
+                    # session; tell the client and wait for the next question.
+                    logger.error(f"Error streaming answer: {e}")
+                    await response_queue.put(ERROR_FRAME)
+                else:
+                    await response_queue.put(ANSWER_COMPLETE_FRAME)
+    finally:
+        await response_queue.put(DISCONNECT_FRAME)
@@ -1,7 +1,7 @@
-import json
+import asyncio
 import logging
+import msgpack
 from fastapi import WebSocket
-from async_queue import AsyncQueue
 import starlette.websockets as ws
 import control_flow_commands as cfc
 
@@ -9,44 +9,67 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("chat")
 
 async def loop(
-    websocket: WebSocket, 
-    questions_queue: AsyncQueue,
-    respone_queue: AsyncQueue
+    websocket: WebSocket,
+    questions_queue: asyncio.Queue,
+    respone_queue: asyncio.Queue
 ):
     """
     Main loop for handling WebSocket messages from the client.
-    
+
+    The client sends msgpack-encoded binary frames, each containing a single
+    string (a question or a control flow command). Responses are queued as
+    msgpack-encoded bytes, ready to be written to the socket.
+
     Args:
         websocket (WebSocket): The WebSocket connection object.
-        questions_queue (AsyncQueue): Queue for handling incoming questions from the client.
-        respone_queue (AsyncQueue): Queue for handling responses that will be sent back to the client.
+        questions_queue (asyncio.Queue): Queue for handling incoming questions from the client.
+        respone_queue (asyncio.Queue): Queue for handling responses that will be sent back to the client.
     """
     await websocket.accept()
     while True:
         try:
-            message = await websocket.receive_text()
-
-            if message == cfc.CFC_CHAT_STARTED:
-                logger.info(f"Start message {message}")
-                questions_queue.enqueue(message)
-            elif message == cfc.CFC_CHAT_STOPPED:
-                logger.info(f"Stop message {message}")
-                questions_queue.enqueue(message)
-                respone_queue.enqueue(json.dumps({
-                    "reporter": "input_message",
-                    "type": "stop_message",
-                    "message": message
-                }))
-            else:
-                logger.info(f"Question: {message}")
-                questions_queue.enqueue(message)
-                respone_queue.enqueue(json.dumps({
-                    "reporter": "input_message",
-                    "type": "question",
-                    "message": message
-                }))
-        except ws.WebSocketDisconnect as e:
+            message = msgpack.unpackb(await websocket.receive_bytes())
+        except ws.WebSocketDisconnect:
             logger.info("Client disconnected")
-            questions_queue.enqueue(cfc.CFC_CLIENT_DISCONNECTED)
-            respone_queue.enqueue(cfc.CFC_CLIENT_DISCONNECTED)
-            break
\ No newline at end of file
+            break
+        except Exception as e:
+            # A text frame or malformed msgpack from a buggy client; close
+            # the socket and shut the session down instead of dying without
+            # notifying the other loops.
+            logger.error(f"Unreadable frame from client: {e}")
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+            break
+
+        # Only strings are valid questions/commands; anything else would
+        # blow up downstream in async_question_to_answer.
+        if not isinstance(message, str):
+            logger.error(f"Ignoring non-string message of type {type(message).__name__}")
+            continue
+
+        if message == cfc.CFC_CHAT_STARTED:
+            logger.info(f"Start message {message}")
+            await questions_queue.put(message)
+        elif message == cfc.CFC_CHAT_STOPPED:
+            logger.info(f"Stop message {message}")
+            await questions_queue.put(message)
+            await respone_queue.put(msgpack.packb({
+                "reporter": "input_message",
+                "type": "stop_message",
+                "message": message
+            }))
+        else:
+            logger.info(f"Question: {message}")
+            await questions_queue.put(message)
+            await respone_queue.put(msgpack.packb({
+                "reporter": "input_message",
+                "type": "question",
+                "message": message
+            }))
+
+    # Every exit path must enqueue the sentinel, or the other loops stay
+    # blocked on their queues forever.
+    await questions_queue.put(cfc.CFC_CLIENT_DISCONNECTED)
+    await respone_queue.put(cfc.CFC_CLIENT_DISCONNECTED)
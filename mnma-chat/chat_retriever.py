@@ -1,7 +1,19 @@
 import os
+import time
+import uuid
 import boto3
+import asyncio
 import logging
+from botocore.config import Config
+from sqlalchemy import create_engine
 from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    FieldCondition,
+    MatchValue,
+)
 from langchain_aws import BedrockEmbeddings
 from langchain_aws import ChatBedrockConverse
 from langchain_core.messages import AIMessage
@@ -11,6 +23,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompts import MessagesPlaceholder
 from langchain.chains.retrieval import create_retrieval_chain
 from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.runnables import RunnableLambda
 from langchain_core.runnables.utils import ConfigurableFieldSpec
 from qdrant_client.conversions.common_types import Filter as Filter
 from langchain_core.runnables.history import RunnableWithMessageHistory
@@ -20,6 +33,75 @@ from langchain.chains.history_aware_retriever import create_history_aware_retrie
 
 loggers = logging.getLogger(__name__)
 
+# Cosine similarity above which a previously answered question is reused.
+SEMANTIC_CACHE_THRESHOLD = 0.90
+# Cached answers older than this are ignored (seconds).
+SEMANTIC_CACHE_TTL = 3600
+
+# One shared engine for all chat histories. Point CHAT_HISTORY_DB_URL at the
+# RDS instance in deployment; the SQLite fallback keeps local runs working.
+HISTORY_DB_URL = os.environ.get("CHAT_HISTORY_DB_URL", "sqlite:///sqlite.db")
+_engine_kwargs = {"pool_pre_ping": True}
+if not HISTORY_DB_URL.startswith("sqlite"):
+    _engine_kwargs.update(pool_size=16, max_overflow=32)
+history_engine = create_engine(HISTORY_DB_URL, **_engine_kwargs)
+
+# Heavy AWS/Qdrant clients are shared by every connection in the process,
+# so Bedrock/Qdrant HTTP connections are reused instead of re-established
+# per websocket session. Each ChatRetriever only carries conversation state.
+# A pool large enough for all concurrent sessions keeps Bedrock requests
+# on warm HTTPS connections instead of paying a TLS handshake per call.
+bedrock_config = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "total_max_attempts": 3},
+    connect_timeout=2,
+    read_timeout=60,
+)
+client_bedrock = boto3.client(
+    service_name='bedrock-runtime',
+    region_name=os.environ.get("AWS_DEFAULT_REGION"),
+    config=bedrock_config,
+)
+embeddings = BedrockEmbeddings(
+    model_id=os.environ.get("EMBEDDING_MODEL_ID"),
+    client=client_bedrock,
+)
+qdrant = QdrantClient(
+    host=os.environ.get("QDRANT_BOOTSTRAP"),
+)
+llm = ChatBedrockConverse(
+    model=os.environ.get("CHAT_MODEL_ID"),
+    temperature=0,
+    max_tokens=None,
+)
+
+class CachedChatMessageHistory(BaseChatMessageHistory):
+    """
+    Wraps a SQL-backed chat history with an in-process message cache, so each
+    turn reads history from memory instead of re-querying the database. The
+    SQL store is read once per process and kept in sync on every append.
+    """
+
+    def __init__(self, backing: SQLChatMessageHistory):
+        self._backing = backing
+        self._messages = None
+
+    @property
+    def messages(self):
+        if self._messages is None:
+            self._messages = list(self._backing.messages)
+        return self._messages
+
+    def add_message(self, message):
+        self._backing.add_message(message)
+        if self._messages is not None:
+            self._messages.append(message)
+
+    def clear(self):
+        self._backing.clear()
+        self._messages = []
+
+
 class ChatRetriever:
     """
     This class handles the setup and execution of a conversational retrieval-augmented generation (RAG) chain 
@@ -40,30 +122,101 @@ class ChatRetriever:
         self.user_id = user_id
         self.files_id = files_id
         self.conversation_id = conversation_id
+        # Computed once per connection; files are sorted so the same file
+        # selection always maps to the same chat id.
+        self._chat_id = f"{user_id}:{conversation_id}"
+        if files_id:
+            self._chat_id += "::" + ",".join(sorted(files_id))
         self.store = {}
-        self.client_bedrock = boto3.client(
-            service_name='bedrock-runtime', 
-            region_name=os.environ.get("AWS_DEFAULT_REGION")
-        )
-        self.embeddings = BedrockEmbeddings(
-            model_id=os.environ.get("EMBEDDING_MODEL_ID"),
-            client=self.client_bedrock,        
-        )
-        self.qdrant = QdrantClient(
-            host=os.environ.get("QDRANT_BOOTSTRAP"),
-        )
+        self.client_bedrock = client_bedrock
+        self.embeddings = embeddings
+        self.qdrant = qdrant
+        self.llm = llm
         self.vector_store = QdrantVectorStore(
             client=self.qdrant,
             collection_name=user_id,
             embedding=self.embeddings,
         )
-        self.llm = ChatBedrockConverse(
-            model=os.environ.get("CHAT_MODEL_ID"),
-            temperature=0,
-            max_tokens=None,
-        )
+        self.cache_collection = f"semcache_{user_id}"
+        self.setup_semantic_cache()
         self.chat_rag = self.create_chat_rag_chain()
 
+    def setup_semantic_cache(self):
+        """
+        Ensures the per-user Qdrant collection backing the semantic answer
+        cache exists.
+        """
+        if not self.qdrant.collection_exists(self.cache_collection):
+            self.qdrant.create_collection(
+                collection_name=self.cache_collection,
+                vectors_config=VectorParams(
+                    size=int(os.environ.get("EMBEDDING_SIZE")),
+                    distance=Distance.COSINE
+                ),
+            )
+
+    def get_cached_answer(self, question_vector):
+        """
+        Looks up a previously generated answer for a semantically similar
+        question in this chat.
+
+        Args:
+            question_vector (list): Embedding of the current question.
+
+        Returns:
+            str | None: The cached answer, or None on miss.
+        """
+        hits = self.qdrant.search(
+            collection_name=self.cache_collection,
+            query_vector=question_vector,
+            query_filter=Filter(must=[
+                FieldCondition(key="chat_id", match=MatchValue(value=self.get_chat_id())),
+            ]),
+            score_threshold=SEMANTIC_CACHE_THRESHOLD,
+            limit=1,
+        )
+        for hit in hits:
+            if time.time() - hit.payload.get("created_at", 0) <= SEMANTIC_CACHE_TTL:
+                return hit.payload["answer"]
+        return None
+
+    def store_cached_answer(self, question_vector, question, answer):
+        """
+        Stores a generated answer in the semantic cache.
+
+        Args:
+            question_vector (list): Embedding of the answered question.
+            question (str): The answered question.
+            answer (str): The generated answer.
+        """
+        self.qdrant.upsert(
+            collection_name=self.cache_collection,
+            points=[PointStruct(
+                id=str(uuid.uuid4()),
+                vector=question_vector,
+                payload={
+                    "chat_id": self.get_chat_id(),
+                    "question": question,
+                    "answer": answer,
+                    "created_at": time.time(),
+                },
+            )],
+        )
+
+    def _record_cached_turn(self, question, answer):
+        """
+        Appends a cache-served turn to the chat history. A cache hit skips
+        RunnableWithMessageHistory entirely, so without this the turn would
+        be invisible to the history-aware retriever and to history replays.
+
+        Args:
+            question (str): The user's question.
+            answer (str): The cached answer served for it.
+        """
+        history = self.get_session_history()
+        history.add_message(HumanMessage(content=question))
+        history.add_message(AIMessage(content=answer))
+
     def get_session_history(self) -> BaseChatMessageHistory:
         """
         Retrieves or initializes chat message history for a given session ID.
@@ -76,17 +229,16 @@ class ChatRetriever:
         """
         chat_id = self.get_chat_id()
         if chat_id not in self.store:
-            self.store[chat_id] = SQLChatMessageHistory(
-                session_id=chat_id, 
-                connection_string="sqlite:///sqlite.db"
+            self.store[chat_id] = CachedChatMessageHistory(
+                SQLChatMessageHistory(
+                    session_id=chat_id,
+                    connection=history_engine
+                )
             )
         return self.store[chat_id]
     
     def get_chat_id(self):
-        chat_id = self.user_id+self.conversation_id
-        if len(self.files_id)!=0:
-            return chat_id.join(self.files_id)
-        return chat_id
+        return self._chat_id
     
     def create_chat_rag_chain(self) -> RunnableWithMessageHistory:
         """
@@ -102,19 +254,35 @@ class ChatRetriever:
             ("human", "{input}"),
         ]) 
         history_aware_retriever = create_history_aware_retriever(
-            self.llm, 
-            self.vector_store.as_retriever(), 
+            self.llm,
+            self.vector_store.as_retriever(),
             contextualize_q_prompt
         )
+        # Retrieval order is not deterministic across turns; sort so equal
+        # result sets produce byte-identical prompts.
+        sort_documents = RunnableLambda(
+            lambda docs: sorted(
+                docs,
+                key=lambda doc: (doc.metadata.get("file_id", ""), doc.page_content),
+            )
+        )
+        # Keep the static system prompt and committed history as a stable
+        # prefix and inject the per-turn retrieved context at the tail, so
+        # Bedrock's prompt-prefix cache stays valid across turns.
         system_prompt = self.config['prompts']['system']
+        rag_context_prompt = self.config['prompts']['rag_context']
         qa_prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
             MessagesPlaceholder("chat_history"),
+            ("system", rag_context_prompt),
             ("human", "{input}")
         ])
 
         question_answer_chain = create_stuff_documents_chain(self.llm, qa_prompt)
-        rag_chain = create_retrieval_chain(history_aware_retriever, question_answer_chain)
+        rag_chain = create_retrieval_chain(
+            history_aware_retriever | sort_documents,
+            question_answer_chain
+        )
         conversational_rag_chain = RunnableWithMessageHistory(
             rag_chain,
             self.get_session_history,
@@ -163,16 +331,64 @@ class ChatRetriever:
     def query(self, question: str):
         """
         Processes a user query through the RAG chain and returns the generated answer.
-        
+
+        Semantically similar questions answered recently in the same chat are
+        served from the cache instead of re-running the chain.
+
         Args:
             question (str): The user's question or input.
-        
+
         Returns:
             str: The generated answer from the conversational RAG chain.
         """
+        question_vector = self.embeddings.embed_query(question)
+        cached = self.get_cached_answer(question_vector)
+        if cached is not None:
+            loggers.info("Semantic cache hit")
+            self._record_cached_turn(question, cached)
+            return cached
+
         answer = self.chat_rag.invoke(
             input= { "input": f"{question}" },
             config={ "configurable": {"chat_id": self.get_chat_id()} },
         )
 
-        return answer["answer"]
\ No newline at end of file
+        self.store_cached_answer(question_vector, question, answer["answer"])
+        return answer["answer"]
+
+    async def astream(self, question: str):
+        """
+        Streams the generated answer for a user query chunk by chunk.
+
+        A semantic cache hit yields the full cached answer at once; on a miss
+        the chain is streamed and the assembled answer is cached afterwards.
+
+        Args:
+            question (str): The user's question or input.
+
+        Yields:
+            str: Incremental pieces of the generated answer.
+        """
+        # Embedding and cache lookups are blocking HTTP calls; keep them off
+        # the event loop so other connections are not starved.
+        question_vector = await asyncio.to_thread(self.embeddings.embed_query, question)
+        cached = await asyncio.to_thread(self.get_cached_answer, question_vector)
+        if cached is not None:
+            loggers.info("Semantic cache hit")
+            await asyncio.to_thread(self._record_cached_turn, question, cached)
+            yield cached
+            return
+
+        answer_parts = []
+        async for chunk in self.chat_rag.astream(
+            input={ "input": f"{question}" },
+            config={ "configurable": {"chat_id": self.get_chat_id()} },
+        ):
+            piece = chunk.get("answer")
+            if piece:
+                answer_parts.append(piece)
+                yield piece
+
+        await asyncio.to_thread(
+            self.store_cached_answer, question_vector, question, "".join(answer_parts)
+        )
\ No newline at end of file
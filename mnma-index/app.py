@@ -1,5 +1,6 @@
 import os
 import yaml
+import uvloop
 import shutil
 import logging
 import asyncio
@@ -12,9 +13,32 @@ from contextlib import asynccontextmanager
 from tenacity import retry, wait_fixed, stop_after_delay
 from sqs import sqs  # Import our SQS instance
 
+# Use the libuv-backed event loop for faster scheduling of the
+# SQS consumer and indexing tasks.
+uvloop.install()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def set_cpu_affinity():
+    """
+    Pin this worker process to a single CPU core so the scheduler stops
+    migrating it across cores (and NUMA nodes), which trashes caches on
+    every socket read. Opt-in via PIN_CPU_AFFINITY=1; the worker index
+    comes from UVICORN_WORKER_ID or falls back to the PID.
+    """
+    if os.environ.get("PIN_CPU_AFFINITY") != "1":
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpu_count = os.cpu_count() or 1
+    worker_id = int(os.environ.get("UVICORN_WORKER_ID", os.getpid()))
+    core = worker_id % cpu_count
+    os.sched_setaffinity(0, {core})
+    logger.info(f"Pinned worker to CPU core {core}")
+
+set_cpu_affinity()
+
 @retry(wait=wait_fixed(30), stop=stop_after_delay(240))
 def setup_sqs_queue():
     """
@@ -44,30 +68,36 @@ async def consume_sqs_messages():
     
     try:
         while True:
-            messages = sqs.receive_messages(
+            # Long poll on a thread; the blocking 20s receive must not
+            # stall the event loop running the indexing tasks.
+            messages = await asyncio.to_thread(
+                sqs.receive_messages,
                 queue_name=queue_name,
                 max_messages=10,  # Batch size
                 wait_time=20  # Long polling timeout in seconds
             )
-            
+
+            receipt_handles = []
             for message in messages:
                 try:
                     logger.info(f"Message received: {message['Body']}")
-                    async_queue.enqueue(message['Body'].encode('utf-8'))
-                    
-                    # Delete message after successful processing
-                    sqs.delete_message(
-                        queue_name=queue_name,
-                        receipt_handle=message['ReceiptHandle']
-                    )
+                    # The queue is bounded; blocking here (before the SQS
+                    # delete below) is what slows the consumer down when
+                    # the indexing pool falls behind.
+                    await async_queue.put(message['Body'].encode('utf-8'))
+                    receipt_handles.append(message['ReceiptHandle'])
                 except Exception as e:
                     logger.error(f"Error processing message: {str(e)}")
                     continue
-            
-            # Small delay to prevent tight polling if queue is empty
-            if not messages:
-                await asyncio.sleep(1)
-                
+
+            # Delete the whole batch in one API call
+            if receipt_handles:
+                await asyncio.to_thread(
+                    sqs.delete_message_batch,
+                    queue_name=queue_name,
+                    receipt_handles=receipt_handles
+                )
+
     except Exception as e:
         logger.error(f"Error in SQS consumer: {str(e)}")
         raise
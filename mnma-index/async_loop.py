@@ -1,36 +1,91 @@
-import json
+import os
 import asyncio
 import logging
+import msgspec
 from indexer import Indexer
-from async_queue import AsyncQueue
 from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
-executor = ThreadPoolExecutor()
 
-async def loop(async_queue: AsyncQueue, indexer: Indexer):
+class IndexMessage(msgspec.Struct):
+    """
+    Shape of one SQS indexing message. msgspec decodes and validates the
+    schema in a single pass, so malformed messages fail fast here instead
+    of deep inside the indexer.
+    """
+    user_id: str
+    file_id: str
+    file_path: str
+    bucket: str
+    path: str
+
+_decoder = msgspec.json.Decoder(IndexMessage)
+
+# Indexing is dominated by Textract/S3/Bedrock waits, so the pool is
+# sized for I/O parallelism rather than CPU count; tune INDEX_WORKERS to
+# the observed remote-call concurrency. Named threads keep stack dumps
+# readable.
+MAX_WORKERS = int(os.getenv("INDEX_WORKERS", "16"))
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="indexer")
+
+# Status updates for indexed files are flushed to RDS in one query once
+# this many have accumulated, or as soon as the pool drains.
+STATUS_FLUSH_SIZE = 10
+
+async def loop(async_queue: asyncio.Queue, indexer: Indexer):
     """
     Continuously process files from the async_queue, index them, and store vectors into vectors database.
-    If the queue is empty, it sleeps for a short period before checking again.
+    The loop blocks on the queue until a message arrives, so no polling is needed.
+
+    At most MAX_WORKERS files are indexed concurrently; when the pool is
+    saturated the loop stops dequeuing, the bounded shared queue fills,
+    and the SQS consumer blocks on put() instead of buffering messages
+    without bound.
 
     Args:
-        async_queue (AsyncQueue): The queue to dequeue file paths from.
+        async_queue (asyncio.Queue): The queue to dequeue file paths from.
         indexer (Indexer): The indexer to process file and store vectors to database.
-        rds_helper (RDSHelper): The RDSHelper to update the status of the files.
 
     Raises:
         Exception: If an error occurs during the file processing or metadata storage.
     """
+    running_loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+    pending_ids = []
+    in_flight = 0
+
+    async def flush_statuses():
+        batch = pending_ids.copy()
+        pending_ids.clear()
+        saved = await asyncio.to_thread(
+            indexer.rds_helper.update_status_for_files, batch, "indexed"
+        )
+        logger.info(f"Saved: {saved}")
+        logger.info(f"updated status for file_ids {batch}")
+
+    async def index_one(parsed):
+        nonlocal in_flight
+        try:
+            file_id = await running_loop.run_in_executor(executor, indexer.index_file, parsed)
+        finally:
+            in_flight -= 1
+            semaphore.release()
+        if file_id:
+            pending_ids.append(file_id)
+        # One UPDATE per batch of files instead of one per file; flush
+        # early when the pool drains so no status lingers unwritten.
+        if pending_ids and (len(pending_ids) >= STATUS_FLUSH_SIZE or in_flight == 0):
+            await flush_statuses()
+
     while True:
-        if async_queue.size() == 0:
-            await asyncio.sleep(0.1)
-            continue
+        message = await async_queue.get()
         try:
-            message = await async_queue.dequeue()
             logger.info(f"Processing message: {message}")
-            parsed = json.loads(message)
-            loop = asyncio.get_running_loop()
-            loop.run_in_executor(executor, indexer.index_file, parsed)
+            parsed = _decoder.decode(message)
         except Exception as e:
             logger.error(f"Error in loop: {e}")
-            logger.error(f"Failed to process message: {message}")
\ No newline at end of file
+            logger.error(f"Failed to process message: {message}")
+            continue
+        await semaphore.acquire()
+        in_flight += 1
+        asyncio.create_task(index_one(parsed))
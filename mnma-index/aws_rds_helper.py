@@ -2,8 +2,10 @@ import os
 import json
 import boto3
 import logging
+import weakref
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import pool
+from psycopg2 import errors
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +13,7 @@ class RDSHelper:
     def __init__(self, config):
         """
         Initialize the RDSHelper with configuration parameters.
-        
+
         Args:
             config (dict): Configuration dictionary containing SQL queries.
         """
@@ -20,58 +22,144 @@ class RDSHelper:
         self.user = os.environ.get("RDS_DB_USER")
         self.password = os.environ.get("RDS_DB_PASSWORD")
         self.port = os.environ.get("RDS_DB_PORT")
-        self.connection = None
-        self.cursor = None
+        # Set RDS_ENDPOINT to skip the describe_db_instances lookup entirely.
+        self._endpoint = os.environ.get("RDS_ENDPOINT")
+        self.pool = None
+        self.prepared = {}
+        # Pooled connections whose statements are already prepared.
+        # psycopg2's C connection type has no __dict__, so the flag cannot
+        # live on the connection object itself; a WeakSet prunes entries
+        # when a connection is closed and collected, so a new connection
+        # can never be mistaken for an old prepared one (unlike id()s,
+        # which CPython reuses).
+        self._prepared_conns = weakref.WeakSet()
         self.rds_config = config
 
     def get_rds_endpoint(self):
         """
         Retrieve the endpoint of the RDS instance from AWS.
 
+        The address never changes for the lifetime of the process, so it is
+        resolved once and memoized; reconnects skip the control-plane call.
+
         Returns:
             str: The endpoint address of the RDS instance.
         """
-        rds_client = boto3.client('rds')
-        response = rds_client.describe_db_instances(DBInstanceIdentifier=self.db_instance)
-        endpoint = response['DBInstances'][0]['Endpoint']['Address']
-        return endpoint
+        if self._endpoint is None:
+            rds_client = boto3.client('rds')
+            response = rds_client.describe_db_instances(DBInstanceIdentifier=self.db_instance)
+            self._endpoint = response['DBInstances'][0]['Endpoint']['Address']
+        return self._endpoint
 
     def connect(self):
         """
-        Establish a connection to the RDS database and initialize the cursor.
+        Create a thread-safe connection pool for the RDS database, so each
+        call borrows its own connection instead of serializing on one.
         """
         try:
             endpoint = self.get_rds_endpoint()
-            self.connection = psycopg2.connect(
+            self._prepared_conns = weakref.WeakSet()
+            # minconn must equal maxconn: ThreadedConnectionPool closes any
+            # connection returned while minconn idle ones already exist, and
+            # that churn would throw away the prepared statements (and the
+            # connections) on every busy/idle transition.
+            self.pool = pool.ThreadedConnectionPool(
+                minconn=20,
+                maxconn=20,
                 host=endpoint,
                 database=self.database,
                 user=self.user,
                 password=self.password,
                 port=self.port
             )
-            self.cursor = self.connection.cursor()
             logger.info("Connected to the database")
         except Exception as error:
             logger.error(f"Error: Could not connect to the database\n{error}")
 
     def disconnect(self):
         """
-        Close the database cursor and connection.
+        Close every connection in the pool.
         """
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        if self.pool:
+            self.pool.closeall()
         logger.info("Disconnected from the database")
 
+    def _getconn(self):
+        """
+        Borrow a connection from the pool, preparing the configured
+        statements the first time that particular connection is used.
+
+        Returns:
+            connection: A pooled psycopg2 connection.
+        """
+        connection = self.pool.getconn()
+        if connection not in self._prepared_conns:
+            try:
+                with connection.cursor() as cursor:
+                    self._prepare_statements(cursor)
+                connection.commit()
+            except Exception:
+                self.pool.putconn(connection)
+                raise
+            self._prepared_conns.add(connection)
+        return connection
+
+    def _execute_prepared(self, connection, cursor, name, params):
+        """
+        Execute a prepared statement, re-preparing on this connection if
+        the server session no longer has it (e.g. the session was reset
+        behind the pool's back).
+
+        Args:
+            connection: The pooled connection the cursor belongs to.
+            cursor: Cursor to execute the statement on.
+            name (str): Statement name from the configuration.
+            params (tuple): Parameters for the statement.
+        """
+        try:
+            cursor.execute(self.prepared[name], params)
+        except errors.InvalidSqlStatementName:
+            logger.warning(f"Prepared statement stmt_{name} missing; re-preparing")
+            connection.rollback()
+            with connection.cursor() as prep_cursor:
+                self._prepare_statements(prep_cursor)
+            connection.commit()
+            self._prepared_conns.add(connection)
+            cursor.execute(self.prepared[name], params)
+
+    def _prepare_statements(self, cursor):
+        """
+        Prepare every parameterized query from the configuration once per
+        connection, so Postgres plans each statement a single time instead
+        of re-parsing it on every call.
+
+        Args:
+            cursor: Cursor on the connection to prepare the statements on.
+        """
+        for name, query in self.rds_config.items():
+            n_params = query.count('%s')
+            if n_params == 0:
+                continue
+            for i in range(1, n_params + 1):
+                query = query.replace('%s', f'${i}', 1)
+            cursor.execute(f"PREPARE stmt_{name} AS {query}")
+            if name not in self.prepared:
+                placeholders = ", ".join(["%s"] * n_params)
+                self.prepared[name] = f"EXECUTE stmt_{name} ({placeholders})"
+
     def create_table(self):
         """
         Create a table in the database using the query from the configuration.
         """
         try:
             create_table_query = self.rds_config['create_table']
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(create_table_query)
+                connection.commit()
+            finally:
+                self.pool.putconn(connection)
             logger.info("Table 'files' created successfully")
         except Exception as error:
             logger.error(f"Error: Could not create table\n{error}")
@@ -89,12 +177,17 @@ class RDSHelper:
             str: JSON string containing the inserted record details or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            insert_query = sql.SQL(self.rds_config['insert_record'])
-            self.cursor.execute(insert_query, (file_id, user_id, file_name, status))
-            record = self.cursor.fetchone()
-            self.connection.commit()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    self._execute_prepared(connection, cursor, 'insert_record', (file_id, user_id, file_name, status))
+                    record = cursor.fetchone()
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self.pool.putconn(connection)
             logger.info(f"Records inserted successfully, number of records: {len(record)}")
             return json.dumps({
                 "id": record[0],
@@ -105,7 +198,6 @@ class RDSHelper:
             })
         except Exception as error:
             logger.error(f"Error: Could not insert record\n{error}")
-            self.connection.rollback()
             return json.dumps({"error": str(error)})
 
     def fetch_records_by_user_id(self, user_id):
@@ -119,11 +211,13 @@ class RDSHelper:
             str: JSON string containing the fetched records or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            fetch_query = sql.SQL(self.rds_config['records_by_user_id'])
-            self.cursor.execute(fetch_query, (user_id,))
-            records = self.cursor.fetchall()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    self._execute_prepared(connection, cursor, 'records_by_user_id', (user_id,))
+                    records = cursor.fetchall()
+            finally:
+                self.pool.putconn(connection)
             logger.info(f"Fetched {len(records)} records, user_id: {user_id}")
             return json.dumps([{
                 "id": record[0],
@@ -135,7 +229,7 @@ class RDSHelper:
         except Exception as error:
             logger.error(f"Error: Could not fetch records\n{error}")
             return json.dumps({"error": str(error)})
-    
+
     def update_status_for_files(self, file_ids, new_status):
         """
         Update the status for multiple files.
@@ -148,12 +242,17 @@ class RDSHelper:
             str: JSON string containing the updated records or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            update_query = sql.SQL(self.rds_config['update_files_status'])
-            self.cursor.execute(update_query, (new_status, file_ids))
-            updated_records = self.cursor.fetchall()
-            self.connection.commit()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    self._execute_prepared(connection, cursor, 'update_files_status', (new_status, file_ids))
+                    updated_records = cursor.fetchall()
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self.pool.putconn(connection)
             logger.info(f"Updated {len(updated_records)} records")
             return json.dumps([{
                 "id": record[0],
@@ -165,7 +264,7 @@ class RDSHelper:
         except Exception as error:
             logger.error(f"Error: Could not update records\n{error}")
             return json.dumps({"error": str(error)})
-    
+
     def fetch_file_statuses_by_user_id(self, user_id):
         """
         Fetch the statuses of files by user ID.
@@ -177,9 +276,13 @@ class RDSHelper:
             str: JSON string containing the fetched file statuses or error message.
         """
         try:
-            fetch_query = sql.SQL(self.rds_config['files_status_by_user_id'])
-            self.cursor.execute(fetch_query, (user_id,))
-            records = self.cursor.fetchall()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    self._execute_prepared(connection, cursor, 'files_status_by_user_id', (user_id,))
+                    records = cursor.fetchall()
+            finally:
+                self.pool.putconn(connection)
             logger.info(f"Fetched {len(records)} file statuses, user_id: {user_id}")
             return json.dumps([{
                 "file_name": record[0],
@@ -188,7 +291,7 @@ class RDSHelper:
         except Exception as error:
             logger.error(f"Error: Could not fetch file statuses\n{error}")
             return json.dumps({"error": str(error)})
-        
+
     def delete_document(self, file_ids, user_id):
         """
         Delete a document from the database.
@@ -200,19 +303,24 @@ class RDSHelper:
             str: JSON string containing the result of the deletion or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            delete_query = sql.SQL(self.rds_config['delete_files'])
-            self.cursor.execute(delete_query, (file_ids, user_id))
-            self.connection.commit()
+            connection = self._getconn()
+            try:
+                with connection.cursor() as cursor:
+                    self._execute_prepared(connection, cursor, 'delete_files', (file_ids, user_id))
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self.pool.putconn(connection)
             logger.info(f"Deleted {len(file_ids)} documents")
             logger.info(f"Documents deleted successfully, file_ids: {file_ids}")
             logger.info(f"Documents deleted successfully, user_id: {user_id}")
             return json.dumps({
-                "message": "Documents deleted successfully", 
+                "message": "Documents deleted successfully",
                 "file_ids": file_ids,
                 "user_id": user_id
             })
         except Exception as error:
             logger.error(f"Error: Could not delete documents\n{error}")
-            return json.dumps({"error": str(error)})
\ No newline at end of file
+            return json.dumps({"error": str(error)})
@@ -1,6 +1,10 @@
-from async_queue import AsyncQueue
+import asyncio
+from async_loop import MAX_WORKERS
 
-# Create a shared instance of AsyncQueue.
+# Create a shared instance of asyncio.Queue.
 # This shared instance will be used across different parts of the application.
-# Ensure that this shared object is managed carefully to prevent concurrency issues.
-async_queue = AsyncQueue()
\ No newline at end of file
+# Bounded to a small multiple of the worker pool: when indexing falls
+# behind, the SQS consumer blocks on put() instead of growing an
+# unbounded in-memory backlog. Ensure that this shared object is managed
+# carefully to prevent concurrency issues.
+async_queue = asyncio.Queue(maxsize=4 * MAX_WORKERS)
@@ -2,11 +2,13 @@ import os
 import uuid
 import boto3
 import logging
+import threading
+from botocore.config import Config
 from aws_rds_helper import RDSHelper
 from qdrant_client import QdrantClient
 from langchain_aws import BedrockEmbeddings
 from langchain_qdrant import QdrantVectorStore
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import Distance, VectorParams, PointStruct
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders.pdf import AmazonTextractPDFLoader
 from langchain_community.document_loaders import (
@@ -18,6 +20,74 @@ from langchain_community.document_loaders import (
 
 loggers = logging.getLogger(__name__)
 
+# Environment configuration is fixed for the process lifetime; read and
+# parse it once at import instead of per file indexed.
+AWS_DEFAULT_REGION = os.environ.get("AWS_DEFAULT_REGION")
+LOCAL_FILES_PATH = os.environ.get("LOCAL_FILES_PATH")
+EMBEDDING_MODEL_ID = os.environ.get("EMBEDDING_MODEL_ID")
+QDRANT_BOOTSTRAP = os.environ.get("QDRANT_BOOTSTRAP")
+EMBEDDING_SIZE = int(os.environ["EMBEDDING_SIZE"]) if os.environ.get("EMBEDDING_SIZE") else None
+
+# Shared client settings: enough pooled HTTPS connections for all worker
+# threads, with adaptive retries instead of the default burst.
+_AWS_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+# One S3 client for the whole process; constructing a client per download
+# re-reads credentials and throws away the keep-alive connection pool.
+_S3 = boto3.client("s3", config=_AWS_CONFIG)
+
+# Documents are embedded in slices of this size, so a large file becomes
+# several small Bedrock requests instead of one huge one and other files
+# in the worker pool interleave between slices.
+INSERT_BATCH_SIZE = 64
+
+# Buffered points are written to Qdrant once this many accumulate for a
+# collection, or when a file finishes, whichever comes first.
+QDRANT_FLUSH_SIZE = 256
+
+class QdrantBatcher:
+    """
+    Buffers points per collection and writes them with one upsert per
+    flush, so bursts of small files indexed on concurrent worker threads
+    share Qdrant requests instead of paying one HTTP round trip each.
+    """
+
+    def __init__(self, client, flush_size=QDRANT_FLUSH_SIZE):
+        self.client = client
+        self.flush_size = flush_size
+        self._lock = threading.Lock()
+        self._buffers = {}
+
+    def add(self, collection_name, points):
+        """
+        Buffer points for a collection, flushing if the buffer is full.
+
+        Args:
+            collection_name (str): The target Qdrant collection.
+            points (list): PointStructs to upsert.
+        """
+        with self._lock:
+            buffer = self._buffers.setdefault(collection_name, [])
+            buffer.extend(points)
+            if len(buffer) < self.flush_size:
+                return
+            self._buffers[collection_name] = []
+        self.client.upsert(collection_name=collection_name, points=buffer)
+
+    def flush(self, collection_name):
+        """
+        Write any buffered points for a collection immediately.
+
+        Args:
+            collection_name (str): The Qdrant collection to flush.
+        """
+        with self._lock:
+            buffer = self._buffers.pop(collection_name, [])
+        if buffer:
+            self.client.upsert(collection_name=collection_name, points=buffer)
+
 class Indexer:
     """
     The Indexer class is responsible for processing and indexing various types of documents into a Qdrant vector store.
@@ -37,21 +107,29 @@ class Indexer:
         Initializes the Indexer with necessary AWS and Qdrant clients, and sets up the vector store.
         """
         self.textract = boto3.client(
-            service_name="textract", 
-            region_name=os.environ.get("AWS_DEFAULT_REGION")
+            service_name="textract",
+            region_name=AWS_DEFAULT_REGION,
+            config=_AWS_CONFIG
         )
         self.client_bedrock = boto3.client(
-            service_name='bedrock-runtime', 
-            region_name=os.environ.get("AWS_DEFAULT_REGION")
+            service_name='bedrock-runtime',
+            region_name=AWS_DEFAULT_REGION,
+            config=_AWS_CONFIG
         )
         self.embeddings = BedrockEmbeddings(
-            model_id=os.environ.get("EMBEDDING_MODEL_ID"),
-            client=self.client_bedrock,        
+            model_id=EMBEDDING_MODEL_ID,
+            client=self.client_bedrock,
         )
         self.qdrant = QdrantClient(
-            host=os.environ.get("QDRANT_BOOTSTRAP"), 
+            host=QDRANT_BOOTSTRAP,
         )
         self.rds_helper = rds_helper
+        self.batcher = QdrantBatcher(self.qdrant)
+        # user_id -> QdrantVectorStore for collections known to exist, so
+        # steady-state indexing skips the collection_exists round trip.
+        self._known_collections = {}
+        # Built once; the splitter compiles its separators on construction.
+        self.text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=250)
 
     def setup_collection(self, user_id):
         """
@@ -63,22 +141,26 @@ class Indexer:
         Returns:
             vector_store: Vector store initialized with the new collection.
         """
-        
+        vector_store = self._known_collections.get(user_id)
+        if vector_store is not None:
+            return vector_store
+
         collection_name = f"{user_id}"
-        embedding_size = os.environ.get("EMBEDDING_SIZE")
         if not self.qdrant.collection_exists(collection_name):
             self.qdrant.create_collection(
                 collection_name=collection_name,
                 vectors_config=VectorParams(
-                    size=embedding_size, 
+                    size=EMBEDDING_SIZE,
                     distance=Distance.COSINE
                 ),
             )
-        return QdrantVectorStore(
+        vector_store = QdrantVectorStore(
             client=self.qdrant,
             collection_name=collection_name,
             embedding=self.embeddings,
         )
+        self._known_collections[user_id] = vector_store
+        return vector_store
                 
 
     def index_file(self, message):
@@ -86,8 +168,7 @@ class Indexer:
         Processes and indexes a file from an S3 bucket based on its file type.
 
         Args:
-            message (dict): A dictionary containing the file metadata, including the bucket and path.
-            loop (asyncio.AbstractEventLoop): The event loop for running asynchronous tasks.
+            message (IndexMessage): The decoded SQS message carrying the file metadata, including the bucket and path.
 
         Depending on the file extension, the method uses appropriate loaders to read the file content:
         - PDFs are processed using AWS Textract.
@@ -96,17 +177,21 @@ class Indexer:
         - Text files are processed using a TextLoader.
 
         The content is then converted into embeddings and stored in the Qdrant vector store.
+        The RDS status update is left to the caller, which batches updates
+        across files into a single query.
+
+        Returns:
+            str | None: The file_id on success, or None if indexing failed.
 
         Raises:
             Exception: If there is an error in loading or vectorizing the documents.
 
         """
-        path, bucket = message["path"], message["bucket"]
-        file_id, user_id = message["file_id"], message["user_id"]
-        vector_store = self.setup_collection(user_id)
+        path, bucket = message.path, message.bucket
+        file_id, user_id = message.file_id, message.user_id
+        self.setup_collection(user_id)
         _, file_extension = os.path.splitext(path)    
         file_extension = file_extension.lower()
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=250)
         loggers.info(f"Extracting text from file: {path}")
 
         if file_extension == ".pdf":
@@ -131,7 +216,7 @@ class Indexer:
             # documents = text_splitter.split_documents(documents)
             # loggers.info(f"Documents split: {len(documents)}")
             loggers.info(f"Loading file content: {path}")
-            documents = loader.load_and_split(text_splitter)
+            documents = loader.load_and_split(self.text_splitter)
             loggers.info(f"Documents loaded: {len(documents)}")
             def update_metadata(doc):
                 doc.metadata["file_id"] = file_id
@@ -140,22 +225,49 @@ class Indexer:
             documents = [update_metadata(doc) for doc in documents]
                 
             loggers.info(f"Inserting into vector storage: {path}")
-            uuids = [str(uuid.uuid4()) for _ in range(len(documents))]
-            vector_store.add_documents(documents=documents, ids=uuids)
-            saved = self.rds_helper.update_status_for_files([file_id], "indexed")
-            loggers.info(f"Saved: {saved}")
-            loggers.info(f"updated status for file_id {file_id}")
-            
+            # One urandom read for all ids instead of one syscall per chunk.
+            raw = os.urandom(16 * len(documents))
+            uuids = [
+                str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4))
+                for i in range(len(documents))
+            ]
+            for start in range(0, len(documents), INSERT_BATCH_SIZE):
+                batch = documents[start:start + INSERT_BATCH_SIZE]
+                batch_ids = uuids[start:start + INSERT_BATCH_SIZE]
+                # One batched Bedrock call per slice instead of one call
+                # per chunk inside add_documents.
+                vectors = self.embeddings.embed_documents(
+                    [doc.page_content for doc in batch]
+                )
+                self.batcher.add(
+                    collection_name=user_id,
+                    points=[
+                        PointStruct(
+                            id=point_id,
+                            vector=vector,
+                            payload={
+                                "page_content": doc.page_content,
+                                "metadata": doc.metadata,
+                            },
+                        )
+                        for point_id, vector, doc in zip(batch_ids, vectors, batch)
+                    ],
+                )
+            # The file only counts as indexed once its points are visible,
+            # so drain whatever this and concurrent files buffered.
+            self.batcher.flush(user_id)
+            return file_id
+
         except Exception as e:
             loggers.error(f"Error to vectorize file: {path}")
             loggers.error(f"Error: {e}")
+            return None
         finally:
             self.delete_file(path)
 
     def delete_file(self, path):
         try:
-            folder_path = os.environ.get("LOCAL_FILES_PATH")
-            file_path = os.path.join(folder_path, os.path.basename(path))
+            file_path = os.path.join(LOCAL_FILES_PATH, os.path.basename(path))
             if os.path.exists(file_path):
                 os.remove(f"{file_path}")
                 loggers.info(f"{file_path} has been removed successfully.")
@@ -173,9 +285,7 @@ class Indexer:
         Returns:
             str: The local path to the downloaded file.
         """
-        s3 = boto3.client("s3")
-        local_folder = os.environ.get("LOCAL_FILES_PATH")
         basename = os.path.basename(path)
-        local_path = os.path.join(local_folder, basename)
-        s3.download_file(bucket, path, local_path)
+        local_path = os.path.join(LOCAL_FILES_PATH, basename)
+        _S3.download_file(bucket, path, local_path)
         return local_path
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
 import uuid
+import asyncio
 import logging
+import aiofiles
 from typing import List
 from dependencies import async_queue
 from dependencies import rds_helper
@@ -27,6 +29,10 @@ ALLOWED_CONTENT_TYPES = [
     "text/csv"  # .csv
 ]
 
+# Uploads are copied to disk in chunks of this size, so peak memory per
+# request stays at one buffer instead of the whole file.
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 @router.get(
     "/get_files/{user_id}",
     response_description='Retrieve files uploaded by user id',
@@ -48,7 +54,7 @@ async def get_files(user_id: str):
             detail="Empty user ID provided"
         )
 
-    return rds_helper.fetch_records_by_user_id(user_id)
+    return await rds_helper.fetch_records_by_user_id(user_id)
 
 @router.get(
     "/get_files_status/{user_id}",
@@ -71,7 +77,7 @@ async def get_files_status(user_id: str):
             detail="Empty user ID provided"
         )
 
-    return rds_helper.fetch_file_statuses_by_user_id(user_id)
+    return await rds_helper.fetch_file_statuses_by_user_id(user_id)
 
 @router.post(
     "/upload_files/", 
@@ -91,8 +97,6 @@ async def upload_files(
         Response: A JSON response containing the UUIDs and filenames of successfully 
         uploaded files or an HTTP 400 error if any file is not an allowed type or is empty.
     """
-    uploaded_files_info = []
-
     for file in files:
         if file.content_type not in ALLOWED_CONTENT_TYPES:
             logger.error(f"Invalid file type: {file.content_type} for file {file.filename}")
@@ -100,10 +104,12 @@ async def upload_files(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid file type: {file.filename}. Allowed types: PDF, DOC, Excel.",
             )
-            
+
+    async def handle(file: UploadFile):
         file_path = os.path.join("uploads", file.filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file.file.read())
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
         async_message = {
             "user_id": user_id,
             "file_id": str(uuid.uuid4()),
@@ -112,8 +118,12 @@ async def upload_files(
         }
         async_queue.enqueue(async_message)
         logger.info(f"File {file_path} uploaded successfully")
-        uploaded_files_info.append(async_message)
-    return { "files": uploaded_files_info }
+        return async_message
+
+    # Write the files concurrently; latency becomes the slowest file
+    # instead of the sum of all of them.
+    uploaded_files_info = await asyncio.gather(*(handle(file) for file in files))
+    return { "files": list(uploaded_files_info) }
 
 @router.post(
     "/remove_file/", 
@@ -141,4 +151,4 @@ async def remove_file(file_ids: List[str], user_id: str):
             detail="Empty user ID provided"
         )
 
-    return rds_helper.delete_document(file_ids, user_id)
\ No newline at end of file
+    return await rds_helper.delete_document(file_ids, user_id)
\ No newline at end of file
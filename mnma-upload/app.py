@@ -2,10 +2,12 @@ import os
 import api
 import yaml
 import shutil
+import uvloop
 import asyncio
 import logging
 from async_loop import loop
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from uploader import Uploader
 from dependencies import async_queue
 from dependencies import rds_helper
@@ -14,6 +16,10 @@ from contextlib import asynccontextmanager
 from tenacity import retry, wait_fixed, stop_after_delay
 from sqs import sqs  # Import our SQS instance
 
+# Use the libuv-backed event loop for faster scheduling of the upload
+# handlers and the SQS batching loop.
+uvloop.install()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("upload")
 
@@ -50,8 +56,8 @@ async def lifespan(app: FastAPI):
 
     try:
         # Initialize RDS and create table
-        rds_helper.connect()
-        rds_helper.create_table()
+        await rds_helper.connect()
+        await rds_helper.create_table()
 
         # Set up AWS S3
         AwsS3Helper.create_directory(bucket, s3_path)
@@ -82,8 +88,7 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
-        async_queue.shutdown()
-        rds_helper.disconnect()
+        await rds_helper.disconnect()
 
     except Exception as e:
         logger.error(f"Error in lifespan: {e}")
@@ -101,6 +106,7 @@ def create_app() -> FastAPI:
     app = FastAPI(
         openapi_url="/upload/openapi.json",
         docs_url="/upload/docs",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     app.include_router(api.router)
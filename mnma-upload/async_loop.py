@@ -1,87 +1,94 @@
 import os
 import asyncio
 import logging
-import json
+import msgspec
 from uploader import Uploader
 from async_queue import AsyncQueue
-from concurrent.futures import ThreadPoolExecutor
-from sqs import sqs 
+from sqs import sqs
 
 logger = logging.getLogger(__name__)
-executor = ThreadPoolExecutor()
 
-def send_sqs_message(message: dict, queue_name: str):
+# SQS caps batch entries at 10 per request
+MAX_SQS_BATCH = 10
+
+class IndexMessage(msgspec.Struct):
     """
-    Send a message to SQS queue.
+    Shape of one SQS indexing message, mirrored in the index service's
+    consumer; msgspec encodes it faster than json.dumps and pins the
+    schema on the producer side.
     """
-    try:
-        response = sqs.send_message(queue_name, json.dumps(message))
-        logger.info(f"Message sent to SQS. MessageId: {response.get('MessageId')}")
-    except Exception as e:
-        logger.error(f"Failed to send message to SQS: {str(e)}")
-        raise
-
-class DummyProducer:
-    """Dummy producer to satisfy the Uploader's interface"""
-    def send(self, *args, **kwargs):
-        pass
+    user_id: str
+    file_id: str
+    file_path: str
+    bucket: str
+    path: str
 
 class UploaderWithSQS:
-    
+
     def __init__(self, uploader: Uploader):
         self.uploader = uploader
         self.queue_name = os.getenv("AWS_SQS_QUEUE")
 
-    def upload(self, message: dict):
+    async def upload_batch(self, messages: list):
         """
-        Upload file and send message to SQS.
+        Upload a batch of files concurrently and notify SQS with a single
+        send_message_batch call for the uploads that succeeded.
         """
-        try:
-            # Pass dummy producer to satisfy the method signature
-            self.uploader.upload(message)
-            
-            # Send message to SQS
-            send_sqs_message(message, self.queue_name)
-            
-        except Exception as e:
-            logger.error(f"Error in upload: {str(e)}")
-            raise
+        results = await asyncio.gather(
+            *(self.uploader.upload(message) for message in messages),
+            return_exceptions=True,
+        )
+
+        uploaded = []
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to upload file: {message['file_path']}: {result}")
+            else:
+                uploaded.append(message)
+
+        if uploaded:
+            bodies = [
+                msgspec.json.encode(IndexMessage(**message)).decode()
+                for message in uploaded
+            ]
+            await asyncio.to_thread(sqs.send_message_batch, self.queue_name, bodies)
+            logger.info(f"Sent {len(uploaded)} messages to SQS in one batch")
 
 async def loop(async_queue: AsyncQueue, uploader: Uploader):
     """
-    Continuously process files from the async_queue.
+    Continuously process files from the async_queue in batches.
     """
     sqs_uploader = UploaderWithSQS(uploader)
-    
+    # Fixed for the process lifetime; no need to re-read per message.
+    bucket = os.environ.get("AWS_BUCKET_NAME")
+    s3_prefix = os.environ.get("AWS_FILES_PATH")
+
     while True:
-        if async_queue.size() == 0:
-            await asyncio.sleep(0.1)
-            continue
-        
         try:
-            message = await async_queue.dequeue()
-            file_id = message["file_id"]
-            user_id = message["user_id"]
-            file_path = message["file_path"]
-            logger.info(f"User with id: {user_id} uploaded file with id: {file_id}, path: {file_path}")
+            # Block until the first message arrives, then drain whatever
+            # else is already queued up to the batch limit.
+            batch = []
+            while len(batch) < MAX_SQS_BATCH:
+                if batch and async_queue.size() == 0:
+                    break
+                message = await async_queue.dequeue()
+                file_id = message["file_id"]
+                user_id = message["user_id"]
+                file_path = message["file_path"]
+                logger.info(f"User with id: {user_id} uploaded file with id: {file_id}, path: {file_path}")
+
+                file_name = os.path.basename(file_path)
+                path = f"{s3_prefix}/{file_name}"
+
+                batch.append({
+                    "user_id": user_id,
+                    "file_id": file_id,
+                    "file_path": file_path,
+                    "bucket": bucket,
+                    "path": path,
+                })
 
-            bucket = os.environ.get("AWS_BUCKET_NAME")
-            path = os.environ.get("AWS_FILES_PATH")
+            await sqs_uploader.upload_batch(batch)
 
-            file_name = os.path.basename(file_path)
-            path = f"{path}/{file_name}"
-            loop = asyncio.get_running_loop()
-            
-            message = {
-                "user_id": user_id,
-                "file_id": file_id,
-                "file_path": file_path,
-                "bucket": bucket,
-                "path": path,
-            }
-            
-            await loop.run_in_executor(executor, sqs_uploader.upload, message)
-            
         except Exception as e:
             logger.error(f"Error in loop: {e}")
-            logger.error(f"Failed to upload file: {file_path}")
\ No newline at end of file
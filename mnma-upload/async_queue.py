@@ -1,42 +1,24 @@
 import asyncio
 
-from collections import deque
-
-class AsyncQueueDequeueInterrupted(Exception):
-    """
-    Exception raised when an attempt to dequeue from the AsyncQueue is interrupted.
-    
-    Args:
-        message (str): The error message to be displayed. Defaults to "AsyncQueue dequeue was interrupted".
-    """
-    def __init__(self, message="AsyncQueue dequeue was interrupted"):
-        self.message = message
-        super().__init__(self.message)
-
 class AsyncQueue:
     """
-    An asynchronous queue implementation using deque and asyncio.Event.
-    It supports enqueue and dequeue operations, with asynchronous waiting for data.
+    An asynchronous queue wrapping asyncio.Queue. Consumers block on
+    dequeue until data arrives, so no polling or wakeup events are needed.
 
     Attributes:
-        _data (deque): The underlying data structure to store queue elements.
-        _presense_of_data (asyncio.Event): Event to signal the presence of data in the queue.
+        _data (asyncio.Queue): The underlying queue holding the elements.
     """
     def __init__(self):
-        self._data = deque([])
-        self._presense_of_data = asyncio.Event()
+        self._data = asyncio.Queue()
 
     def enqueue(self, value):
         """
-        Add a value to the end of the queue. If the queue was empty, set the event to indicate data presence.
+        Add a value to the end of the queue, waking any waiting consumer.
 
         Args:
             value: The value to be added to the queue.
         """
-        self._data.append(value)
-
-        if len(self._data) == 1:
-            self._presense_of_data.set()
+        self._data.put_nowait(value)
 
     async def dequeue(self):
         """
@@ -44,21 +26,8 @@ class AsyncQueue:
 
         Returns:
             The value from the front of the queue.
-
-        Raises:
-            AsyncQueueDequeueInterrupted: If the dequeue operation is interrupted unexpectedly.
         """
-        await self._presense_of_data.wait()
-
-        if len(self._data) < 1:
-            raise AsyncQueueDequeueInterrupted("AsyncQueue was dequeue was interrupted")
-
-        result = self._data.popleft()
-
-        if not self._data:
-            self._presense_of_data.clear()
-
-        return result
+        return await self._data.get()
 
     def size(self):
         """
@@ -67,11 +36,4 @@ class AsyncQueue:
         Returns:
             int: The number of elements in the queue.
         """
-        result = len(self._data)
-        return result
-
-    def shutdown(self):
-        """
-        Set the event to indicate data presence, potentially used to wake up consumers for shutdown purposes.
-        """
-        self._presense_of_data.set()
\ No newline at end of file
+        return self._data.qsize()
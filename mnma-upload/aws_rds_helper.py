@@ -1,10 +1,7 @@
 import os
-import json
-import yaml
 import boto3
 import logging
-import psycopg2
-from psycopg2 import sql
+import asyncpg
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +9,7 @@ class RDSHelper:
     def __init__(self, config):
         """
         Initialize the RDSHelper with configuration parameters.
-        
+
         Args:
             config (dict): Configuration dictionary containing SQL queries.
         """
@@ -21,63 +18,67 @@ class RDSHelper:
         self.user = os.environ.get("RDS_DB_USER")
         self.password = os.environ.get("RDS_DB_PASSWORD")
         self.port = os.environ.get("RDS_DB_PORT")
-        self.connection = None
-        self.cursor = None
+        # Set RDS_ENDPOINT to skip the describe_db_instances lookup entirely.
+        self._endpoint = os.environ.get("RDS_ENDPOINT")
+        self.pool = None
         self.rds_config = config
 
     def get_rds_endpoint(self):
         """
         Retrieve the endpoint of the RDS instance from AWS.
 
+        The address never changes for the lifetime of the process, so it is
+        resolved once and memoized; reconnects skip the control-plane call.
+
         Returns:
             str: The endpoint address of the RDS instance.
         """
-        rds_client = boto3.client('rds')
-        response = rds_client.describe_db_instances(DBInstanceIdentifier=self.db_instance)
-        endpoint = response['DBInstances'][0]['Endpoint']['Address']
-        return endpoint
+        if self._endpoint is None:
+            rds_client = boto3.client('rds')
+            response = rds_client.describe_db_instances(DBInstanceIdentifier=self.db_instance)
+            self._endpoint = response['DBInstances'][0]['Endpoint']['Address']
+        return self._endpoint
 
-    def connect(self):
+    async def connect(self):
         """
-        Establish a connection to the RDS database and initialize the cursor.
+        Create the asyncpg connection pool for the RDS database.
         """
         try:
             endpoint = self.get_rds_endpoint()
-            self.connection = psycopg2.connect(
+            self.pool = await asyncpg.create_pool(
                 host=endpoint,
                 database=self.database,
                 user=self.user,
                 password=self.password,
-                port=self.port
+                port=int(self.port) if self.port else None,
+                min_size=4,
+                max_size=20
             )
-            self.cursor = self.connection.cursor()
             logger.info("Connected to the database")
         except Exception as error:
             logger.error(f"Error: Could not connect to the database\n{error}")
 
-    def disconnect(self):
+    async def disconnect(self):
         """
-        Close the database cursor and connection.
+        Close the database connection pool.
         """
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        if self.pool:
+            await self.pool.close()
         logger.info("Disconnected from the database")
 
-    def create_table(self):
+    async def create_table(self):
         """
         Create a table in the database using the query from the configuration.
         """
         try:
             create_table_query = self.rds_config['create_table']
-            self.cursor.execute(create_table_query)
-            self.connection.commit()
+            async with self.pool.acquire() as connection:
+                await connection.execute(create_table_query)
             logger.info("Table 'peakfiles' created successfully")
         except Exception as error:
             logger.error(f"Error: Could not create table\n{error}")
 
-    def insert_record(self, file_id, user_id, file_name, status):
+    async def insert_record(self, file_id, user_id, file_name, status):
         """
         Insert a record into the database.
 
@@ -87,29 +88,21 @@ class RDSHelper:
             file_name (str): Name of the file.
             status (str): Status of the file.
         Returns:
-            str: JSON string containing the inserted record details or error message.
+            dict: Dictionary containing the inserted record details or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            insert_query = sql.SQL(self.rds_config['insert_record'])
-            self.cursor.execute(insert_query, (file_id, user_id, file_name, status))
-            record = self.cursor.fetchone()
-            self.connection.commit()
+            insert_query = self.rds_config['insert_record']
+            async with self.pool.acquire() as connection:
+                record = await connection.fetchrow(
+                    insert_query, file_id, user_id, file_name, status
+                )
             logger.info(f"Records inserted successfully, number of records: {len(record)}")
-            return json.dumps({
-                "id": record[0],
-                "file_id": record[1],
-                "user_id": record[2],
-                "file_name": record[3],
-                "status": record[4]
-            })
+            return dict(record)
         except Exception as error:
             logger.error(f"Error: Could not insert record\n{error}")
-            self.connection.rollback()
-            return json.dumps({"error": str(error)})
+            return {"error": str(error)}
 
-    def fetch_records_by_user_id(self, user_id):
+    async def fetch_records_by_user_id(self, user_id):
         """
         Fetch records from the database by user ID.
 
@@ -117,27 +110,21 @@ class RDSHelper:
             user_id (str): ID of the user.
 
         Returns:
-            str: JSON string containing the fetched records or error message.
+            list: List of dictionaries containing the fetched records or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            fetch_query = sql.SQL(self.rds_config['records_by_user_id'])
-            self.cursor.execute(fetch_query, (user_id,))
-            records = self.cursor.fetchall()
+            fetch_query = self.rds_config['records_by_user_id']
+            async with self.pool.acquire() as connection:
+                records = await connection.fetch(fetch_query, user_id)
             logger.info(f"Fetched {len(records)} records, user_id: {user_id}")
-            return [{
-                "id": record[0],
-                "file_id": record[1],
-                "user_id": record[2],
-                "file_name": record[3],
-                "status": record[4]
-            } for record in records]
+            # asyncpg Records carry column names; dict() converts in C
+            # without re-walking each row field by field in Python.
+            return [dict(record) for record in records]
         except Exception as error:
             logger.error(f"Error: Could not fetch records\n{error}")
             return {"error": str(error)}
-    
-    def update_status_for_files(self, file_ids, new_status):
+
+    async def update_status_for_files(self, file_ids, new_status):
         """
         Update the status for multiple files.
 
@@ -146,28 +133,19 @@ class RDSHelper:
             new_status (str): New status to set for the files.
 
         Returns:
-            str: JSON string containing the updated records or error message.
+            list: List of dictionaries containing the updated records or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            update_query = sql.SQL(self.rds_config['update_files_status'])
-            self.cursor.execute(update_query, (new_status, file_ids))
-            updated_records = self.cursor.fetchall()
-            self.connection.commit()
+            update_query = self.rds_config['update_files_status']
+            async with self.pool.acquire() as connection:
+                updated_records = await connection.fetch(update_query, new_status, file_ids)
             logger.info(f"Updated {len(updated_records)} records")
-            return json.dumps([{
-                "id": record[0],
-                "file_id": record[1],
-                "user_id": record[2],
-                "file_name": record[3],
-                "status": record[4]
-            } for record in updated_records])
+            return [dict(record) for record in updated_records]
         except Exception as error:
             logger.error(f"Error: Could not update records\n{error}")
-            return json.dumps({"error": str(error)})
-    
-    def fetch_file_statuses_by_user_id(self, user_id):
+            return {"error": str(error)}
+
+    async def fetch_file_statuses_by_user_id(self, user_id):
         """
         Fetch the statuses of files by user ID.
 
@@ -175,24 +153,19 @@ class RDSHelper:
             user_id (str): ID of the user.
 
         Returns:
-            str: JSON string containing the fetched file statuses or error message.
+            list: List of dictionaries containing the fetched file statuses or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            fetch_query = sql.SQL(self.rds_config['files_status_by_user_id'])
-            self.cursor.execute(fetch_query, (user_id,))
-            records = self.cursor.fetchall()
+            fetch_query = self.rds_config['files_status_by_user_id']
+            async with self.pool.acquire() as connection:
+                records = await connection.fetch(fetch_query, user_id)
             logger.info(f"Fetched {len(records)} file statuses, user_id: {user_id}")
-            return [{
-                "file_name": record[0],
-                "status": record[1]
-            } for record in records]
+            return [dict(record) for record in records]
         except Exception as error:
             logger.error(f"Error: Could not fetch file statuses\n{error}")
             return {"error": str(error)}
-        
-    def delete_document(self, file_ids, user_id):
+
+    async def delete_document(self, file_ids, user_id):
         """
         Delete a document from the database.
 
@@ -200,22 +173,20 @@ class RDSHelper:
             file_ids (list): List of file IDs to delete.
 
         Returns:
-            str: JSON string containing the result of the deletion or error message.
+            dict: Dictionary containing the result of the deletion or error message.
         """
         try:
-            if self.cursor.closed:
-                self.connect()
-            delete_query = sql.SQL(self.rds_config['delete_files'])
-            self.cursor.execute(delete_query, (file_ids, user_id))
-            self.connection.commit()
+            delete_query = self.rds_config['delete_files']
+            async with self.pool.acquire() as connection:
+                await connection.execute(delete_query, file_ids, user_id)
             logger.info(f"Deleted {len(file_ids)} documents")
             logger.info(f"Documents deleted successfully, file_ids: {file_ids}")
             logger.info(f"Documents deleted successfully, user_id: {user_id}")
             return {
-                "message": "Documents deleted successfully", 
+                "message": "Documents deleted successfully",
                 "file_ids": file_ids,
                 "user_id": user_id
             }
         except Exception as error:
             logger.error(f"Error: Could not delete documents\n{error}")
-            return {"error": str(error)}
\ No newline at end of file
+            return {"error": str(error)}
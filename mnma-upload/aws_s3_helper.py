@@ -3,9 +3,13 @@
 import os
 import re
 import boto3
-import json
+import orjson
 import logging
-import datetime
+import functools
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
 from typing import(
     List, 
     Union, 
@@ -16,11 +20,91 @@ from typing import(
 
 logger = logging.getLogger(__name__)
 
-def serialize_datetime(obj):
-    """Serialization helper"""
-    if isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    raise TypeError('Type not serializable')
+# Shared client settings: enough pooled connections for concurrent worker
+# threads (the default pool of 10 discards connections under load and
+# re-handshakes), keepalive to hold them open, and adaptive retries.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
+# Multipart transfers: files over 8 MiB are split into 16 MiB parts sent
+# by up to 10 threads, which also lifts the 5 GiB single-PUT limit.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Compiled once; escape_s3_name runs per path component in tight loops.
+_S3_ESCAPE_RE = re.compile(r'[^a-zA-Z0-9\!\-\_\.*\'\(\) ]')
+
+
+class _BulkS3:
+    """
+    Bucket-bound view over the shared S3 client for bulk operations.
+
+    Resolves the client and bucket once, so per-key work inside loops is a
+    plain method call instead of a client-cache lookup per operation.
+    Obtained via AwsS3Helper.bulk(bucket).
+    """
+
+    def __init__(self, bucket: str):
+        self.bucket = bucket
+        self.client = _build_client('s3', os.getenv('S3_ENDPOINT'))
+
+    def list(self, prefix: str) -> List[str]:
+        """List keys and common prefixes under the given prefix."""
+        prefix_path = prefix.rstrip('/') + '/'
+        item_list = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix_path, Delimiter='/'):
+            item_list.extend([r.get('Key') for r in page.get('Contents', [])])
+            item_list.extend(
+                [r.get('Prefix').strip('/') for r in page.get('CommonPrefixes', [])]
+            )
+        return item_list
+
+    def upload(self, file: Union[str, Any], path: str) -> None:
+        """Upload a path or file-like object to the bound bucket."""
+        if isinstance(file, str):
+            self.client.upload_file(file, self.bucket, path, Config=TRANSFER_CONFIG)
+        else:
+            self.client.upload_fileobj(file, self.bucket, path, Config=TRANSFER_CONFIG)
+
+    def delete_many(self, keys: List[str]) -> None:
+        """Delete keys in delete_objects batches of 1000, concurrently when large."""
+        if not keys:
+            return
+
+        def delete_chunk(chunk):
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in chunk]},
+            )
+
+        chunks = [keys[i:i + 1000] for i in range(0, len(keys), 1000)]
+        if len(chunks) == 1:
+            delete_chunk(chunks[0])
+            return
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(delete_chunk, chunks))
+
+@functools.lru_cache(maxsize=None)
+def _build_client(name: str, endpoint: Union[str, None]) -> boto3.client:
+    """
+    Construct a boto3 client once per (service, endpoint) pair.
+
+    Client construction resolves credentials and parses service models on
+    every call, which costs tens of milliseconds; boto3 clients are
+    thread-safe, so one shared instance per service serves the whole
+    process and keeps its HTTPS connections warm.
+    """
+    if endpoint:
+        return boto3.client(name, endpoint_url=endpoint, config=CLIENT_CONFIG)
+    return boto3.client(name, config=CLIENT_CONFIG)
 
 
 class AwsS3Helper:
@@ -46,10 +130,21 @@ class AwsS3Helper:
         """
         # Check if we have an environment endpoint with the client name
         endpoint = os.getenv(f'{name}_endpoint'.upper())
-        if endpoint:
-            return boto3.client(name, endpoint_url=endpoint)
-        # Else use the default
-        return boto3.client(name)
+        return _build_client(name, endpoint)
+
+    @staticmethod
+    def bulk(bucket: str) -> '_BulkS3':
+        """
+        Get a bucket-bound helper for bulk operations.
+
+        Args:
+            bucket (str): The name of the S3 bucket to bind.
+
+        Returns:
+            _BulkS3: Helper exposing list/upload/delete_many against one
+            pre-resolved client and bucket.
+        """
+        return _BulkS3(bucket)
 
     @staticmethod
     def escape_s3_name(name: str) -> str:
@@ -62,8 +157,7 @@ class AwsS3Helper:
         Returns:
             str: Escaped name.
         """
-        escape_name = re.sub(r'[^a-zA-Z0-9\!\-\_\.*\'\(\) ]', '', name)
-        return escape_name
+        return _S3_ESCAPE_RE.sub('', name)
 
     @staticmethod
     def create_directory(path: str, bucket: str) -> None:
@@ -92,10 +186,9 @@ class AwsS3Helper:
         """
         s3 = AwsS3Helper.get_client('s3')
         if isinstance(file, str):
-            with open(file, 'rb') as fs:
-                s3.upload_fileobj(fs, bucket, path)
+            s3.upload_file(file, bucket, path, Config=TRANSFER_CONFIG)
         else:
-            s3.upload_fileobj(file, bucket, path)
+            s3.upload_fileobj(file, bucket, path, Config=TRANSFER_CONFIG)
 
     @staticmethod
     def check_documents(path: str, bucket: str) -> bool:
@@ -126,18 +219,18 @@ class AwsS3Helper:
             List[str]: List of document paths.
         """
         s3 = AwsS3Helper.get_client('s3')
-        prefix_path = re.sub(r'\/$', '', path) + '/'
-        response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix_path, Delimiter='/')
+        prefix_path = path.rstrip('/') + '/'
         item_list = []
 
-        if response['KeyCount'] > 0:
+        # Paginate: a single list_objects_v2 call silently truncates at
+        # 1000 keys.
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix_path, Delimiter='/'):
             # Join CommonPrefixes and Contents as array
-            if 'Contents' in response:
-                item_list.extend([r.get('Key') for r in response['Contents']])
-            if 'CommonPrefixes' in response:
-                item_list.extend(
-                    [r.get('Prefix').strip('/') for r in response['CommonPrefixes']]
-                )
+            item_list.extend([r.get('Key') for r in page.get('Contents', [])])
+            item_list.extend(
+                [r.get('Prefix').strip('/') for r in page.get('CommonPrefixes', [])]
+            )
 
         return item_list
 
@@ -154,12 +247,11 @@ class AwsS3Helper:
             List[str]: List of S3 object keys.
         """
         s3 = AwsS3Helper.get_client('s3')
-        response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-        return (
-            [r.get('Key') for r in response['Contents']]
-            if response['KeyCount'] > 0
-            else []
-        )
+        keys = []
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            keys.extend([r.get('Key') for r in page.get('Contents', [])])
+        return keys
 
     @staticmethod
     def write_file(content: str, path: str, bucket: str) -> bool:
@@ -212,25 +304,47 @@ class AwsS3Helper:
         return True
     
     @staticmethod
-    def read_file_content(path: str, bucket: str) -> bytes:
+    def read_file_content(path: str, bucket: str, chunk_size: int = None) -> bytes:
         """
         Retrieves the content of a file stored in an S3 bucket.
 
         This static method connects to an S3 bucket using a predefined S3 client,
         downloads the file specified by its path within the bucket, and returns
-        its content as a byte string.
+        its content as a byte string. Pass chunk_size to get an iterator of
+        byte chunks instead, keeping memory flat for large objects.
 
         Args:
             path (str): The S3 key (path) of the file within the bucket.
             bucket (str): The name of the S3 bucket where the file is stored.
+            chunk_size (int): Optional; if set, stream the body in chunks
+                of this many bytes instead of reading it all at once.
 
         Returns:
-           bytes: The content of the file as a byte string.
+           bytes: The content of the file as a byte string, or an iterator
+           of byte chunks when chunk_size is given.
         """
         s3 = AwsS3Helper.get_client('s3')
         s3_object = s3.get_object(Bucket=bucket, Key=path)
-        file_content = s3_object['Body'].read()
-        return file_content
+        if chunk_size:
+            return s3_object['Body'].iter_chunks(chunk_size)
+        return s3_object['Body'].read()
+
+    @staticmethod
+    def read_file_to(path: str, bucket: str, dst: Any) -> None:
+        """
+        Stream a file from S3 into a writable binary file object.
+
+        Uses download_fileobj under the shared TransferConfig, which
+        fetches large objects as concurrent range GETs without ever
+        materializing the whole body in memory.
+
+        Args:
+            path (str): The S3 key (path) of the file within the bucket.
+            bucket (str): The name of the S3 bucket where the file is stored.
+            dst (Any): A writable binary file-like object.
+        """
+        s3 = AwsS3Helper.get_client('s3')
+        s3.download_fileobj(bucket, path, dst, Config=TRANSFER_CONFIG)
 
     @staticmethod
     def read_file(path: str, bucket: str) -> dict:
@@ -261,8 +375,8 @@ class AwsS3Helper:
         """
         s3 = AwsS3Helper.get_client('s3')
         content_obj = s3.get_object(Bucket=bucket, Key=path)
-        content_str = content_obj['Body'].read().decode('utf-8')
-        return json.loads(content_str)
+        # orjson parses bytes directly; no intermediate decoded string.
+        return orjson.loads(content_obj['Body'].read())
 
     @staticmethod
     def write_json(data: dict, path: str, bucket: str) -> bool:
@@ -278,8 +392,12 @@ class AwsS3Helper:
             bool: True if the operation was successful, False otherwise.
         """
         s3 = AwsS3Helper.get_client('s3')
+        # orjson emits bytes in one pass and serializes datetimes natively.
         s3.put_object(
-            Bucket=bucket, Key=path, Body=json.dumps(data, default=serialize_datetime)
+            Bucket=bucket,
+            Key=path,
+            Body=orjson.dumps(data),
+            ContentType='application/json',
         )
         return True
 
@@ -299,8 +417,12 @@ class AwsS3Helper:
         try:
             s3.head_object(Bucket=bucket, Key=path)
             return True
-        except Exception:
-            return False
+        except ClientError as error:
+            # Only a missing key means False; throttling and 5xx errors
+            # must surface instead of masquerading as absence.
+            if error.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
 
     @staticmethod
     def update_json(path: str, bucket: str, update_fnc: Callable[[dict], dict]) -> dict:
@@ -317,14 +439,14 @@ class AwsS3Helper:
         """
         s3 = AwsS3Helper.get_client('s3')
         content_obj = s3.get_object(Bucket=bucket, Key=path)
-        content_str = content_obj['Body'].read().decode('utf-8')
-        data = json.loads(content_str)
+        data = orjson.loads(content_obj['Body'].read())
         new_data = update_fnc(data)
         new_data = {**data, **new_data}
         s3.put_object(
             Bucket=bucket,
             Key=path,
-            Body=json.dumps(new_data, default=serialize_datetime),
+            Body=orjson.dumps(new_data),
+            ContentType='application/json',
         )
         return new_data
 
@@ -333,12 +455,16 @@ class AwsS3Helper:
         """
         Read the directory at the specified S3 path and delete all files.
 
+        Keys are removed with the batch delete_objects API, up to 1000 per
+        request; multiple chunks are issued concurrently for large folders
+        instead of one DeleteObject round trip per key.
+
         Args:
             path (str): The S3 path of the directory.
             bucket (str): The name of the S3 bucket.
         """
-        for item in AwsS3Helper.get_documents_list(path, bucket):
-            AwsS3Helper.delete_file(item, bucket)
+        bulk = AwsS3Helper.bulk(bucket)
+        bulk.delete_many(bulk.list(path))
 
     @staticmethod
     def format_generic_s3_path(*path_components: str) -> str:
@@ -370,12 +496,10 @@ class AwsS3Helper:
         Returns:
             str: The formatted generic S3 path.
         """
-        # Escape and join provided components
-        escaped_components = [
-            AwsS3Helper.escape_s3_name(component) for component in path_components
-        ]
-        s3_path = '/'.join(escaped_components)
-        return s3_path
+        # Escape and join provided components; the compiled pattern's sub
+        # is bound once instead of two attribute lookups per component.
+        sub = _S3_ESCAPE_RE.sub
+        return '/'.join(sub('', component) for component in path_components)
 
     @staticmethod
     def download_documents_with_generic_s3_path(
@@ -408,17 +532,16 @@ class AwsS3Helper:
         # Create the local directory if it doesn't exist
         os.makedirs(dir_name, exist_ok=True)
 
-        # Create S3 client outside the with statement
         s3 = AwsS3Helper.get_client('s3')
 
-        # Download documents
-        for document in document_list:
-            try:
-                document_obj = s3.get_object(Bucket=bucket, Key=document)
-                document_data = document_obj['Body'].read()
-                document_path = os.path.join(dir_name, os.path.basename(document))
-                with open(document_path, 'wb') as f:
-                    f.write(document_data)
-            finally:
-                # Close the S3 client explicitly after using it
-                s3.close()
\ No newline at end of file
+        def download_one(document):
+            local_path = os.path.join(dir_name, os.path.basename(document))
+            with open(local_path, 'wb') as f:
+                s3.download_fileobj(bucket, document, f, Config=TRANSFER_CONFIG)
+
+        # Download in parallel; sequential blocking reads left the worker
+        # idle for most of each round trip. The shared client is cached
+        # for the whole process and must not be closed here - the old
+        # per-iteration close() tore it down after the first file.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(download_one, document_list))
\ No newline at end of file
@@ -1,12 +1,20 @@
 import yaml
+from types import MappingProxyType
 from async_queue import AsyncQueue
 from aws_rds_helper import RDSHelper
 
+# Prefer the libyaml loader when available; it parses ~10x faster than
+# the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Create a shared instance of AsyncQueue.
 # This shared instance will be used across different parts of the application.
 # Ensure that this shared object is managed carefully to prevent concurrency issues.
 async_queue = AsyncQueue()
-with open('config.yml', 'r') as file:
-    config = yaml.safe_load(file)   
-    
-rds_helper = RDSHelper(config['rds'])
\ No newline at end of file
+with open('config.yml', 'r', encoding='utf-8') as file:
+    config = MappingProxyType(yaml.load(file, Loader=SafeLoader))
+
+rds_helper = RDSHelper(config['rds'])
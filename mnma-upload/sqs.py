@@ -1,4 +1,5 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
 from typing import Optional, Dict, Any
@@ -7,27 +8,46 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Mirrors the S3 helper's client settings: pooled keepalive connections
+# sized for concurrent workers, with adaptive retries.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
 class SQSClient:
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
+    """
+    Thin wrapper around the boto3 SQS client. The module exports a single
+    shared instance (`sqs`) below; the old __new__-based singleton still
+    re-ran __init__ on every call, so the pattern is dropped in favour of
+    one unconditional construction at import.
+    """
+
     def __init__(self):
-        if not hasattr(self, 'client'):
-            self.region = os.getenv('AWS_DEFAULT_REGION', 'us-west-2')
-            self.aws_access_key_id = os.getenv('AWS_ACCESS_KEY_ID')
-            self.aws_secret_access_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-            
-            self.client = boto3.client(
-                'sqs',
-                region_name=self.region,
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key
-            )
-            self.queue_urls: Dict[str, str] = {}
+        self.region = os.getenv('AWS_DEFAULT_REGION', 'us-west-2')
+
+        # Credentials come from boto3's default provider chain (env vars,
+        # shared config, IMDS/role); passing them explicitly disabled the
+        # chain's caching and refresh.
+        self.client = boto3.client(
+            'sqs',
+            region_name=self.region,
+            config=CLIENT_CONFIG
+        )
+        self.queue_urls: Dict[str, str] = {}
+
+        # Prime the cache for the configured queue so the first send skips
+        # the resolution round trip. A failure here is not fatal - the
+        # queue may not exist yet and the startup retry logic resolves it
+        # lazily through get_queue_url.
+        default_queue = os.getenv('AWS_SQS_QUEUE')
+        if default_queue:
+            try:
+                response = self.client.get_queue_url(QueueName=default_queue)
+                self.queue_urls[default_queue] = response['QueueUrl']
+            except Exception:
+                logger.info(f"Queue {default_queue} not resolvable yet; resolving lazily")
 
     def create_queue(self, queue_name: str, fifo: bool = False, **attributes) -> str:
         try:
@@ -105,8 +125,49 @@ class SQSClient:
             logger.error(f"Error sending message to {queue_name}: {str(e)}")
             raise
 
-    def receive_messages(self, queue_name: str, max_messages: int = 1, 
-                        wait_time: int = 0) -> list:
+    def send_message_batch(self, queue_name: str, messages: list,
+                           message_group_id: Optional[str] = None) -> None:
+        try:
+            queue_url = self.get_queue_url(queue_name)
+
+            entries = []
+            for i, message in enumerate(messages):
+                if not isinstance(message, str):
+                    message = json.dumps(message)
+                entry = {'Id': str(i), 'MessageBody': message}
+                if message_group_id:
+                    entry['MessageGroupId'] = message_group_id
+                entries.append(entry)
+
+            for start in range(0, len(entries), 10):
+                chunk = entries[start:start + 10]
+                response = self.client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=chunk
+                )
+
+                # Retry only the entries SQS reported as failed
+                failed_ids = {f['Id'] for f in response.get('Failed', [])}
+                if failed_ids:
+                    retry_entries = [e for e in chunk if e['Id'] in failed_ids]
+                    response = self.client.send_message_batch(
+                        QueueUrl=queue_url,
+                        Entries=retry_entries
+                    )
+                    for failure in response.get('Failed', []):
+                        logger.error(
+                            f"Failed to send message {failure['Id']} to {queue_name}: "
+                            f"{failure.get('Message')}"
+                        )
+
+        except Exception as e:
+            logger.error(f"Error sending messages to {queue_name}: {str(e)}")
+            raise
+
+    # Long polling by default: one request waits up to 20s server-side for
+    # up to 10 messages instead of hammering the API with empty receives.
+    def receive_messages(self, queue_name: str, max_messages: int = 10,
+                        wait_time: int = 20) -> list:
         try:
             queue_url = self.get_queue_url(queue_name)
             
@@ -135,6 +196,39 @@ class SQSClient:
             logger.error(f"Error deleting message from {queue_name}: {str(e)}")
             raise
 
+    def delete_message_batch(self, queue_name: str, receipt_handles: list) -> None:
+        try:
+            queue_url = self.get_queue_url(queue_name)
+
+            entries = [
+                {'Id': str(i), 'ReceiptHandle': handle}
+                for i, handle in enumerate(receipt_handles)
+            ]
+            for start in range(0, len(entries), 10):
+                chunk = entries[start:start + 10]
+                response = self.client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=chunk
+                )
+
+                # Retry only the entries SQS reported as failed
+                failed_ids = {f['Id'] for f in response.get('Failed', [])}
+                if failed_ids:
+                    retry_entries = [e for e in chunk if e['Id'] in failed_ids]
+                    response = self.client.delete_message_batch(
+                        QueueUrl=queue_url,
+                        Entries=retry_entries
+                    )
+                    for failure in response.get('Failed', []):
+                        logger.error(
+                            f"Failed to delete message {failure['Id']} from {queue_name}: "
+                            f"{failure.get('Message')}"
+                        )
+
+        except Exception as e:
+            logger.error(f"Error deleting messages from {queue_name}: {str(e)}")
+            raise
+
     def delete_queue(self, queue_name: str) -> None:
         try:
             queue_url = self.get_queue_url(queue_name)